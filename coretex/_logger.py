@@ -15,23 +15,26 @@
 #     You should have received a copy of the GNU Affero General Public License
 #     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from datetime import datetime
+import time
 
 from ._folder_manager import folder_manager
 from .logging import initializeLogger, LogSeverity
 from .configuration import CONFIG_DIR
 
 
+def _logFileName() -> str:
+    # time.strftime avoids constructing a datetime object just to format it
+    return f"{time.strftime('%Y-%m-%d_%H-%M-%S')}.log"
+
+
 def _initializeDefaultLogger() -> None:
-    logName = datetime.now().strftime("%Y-%m-%d_%H-%M-%S.%f%z")
-    logPath = folder_manager.coretexpylibLogs.joinpath(logName).with_suffix(".log")
+    logPath = folder_manager.coretexpylibLogs / _logFileName()
 
     initializeLogger(LogSeverity.info, logPath, jsonOutput = False)
 
 
 def _initializeCLILogger() -> None:
-    logName = datetime.now().strftime("%Y-%m-%d_%H-%M-%S.%f%z")
     logPath = CONFIG_DIR / "logs"
     logPath.mkdir(exist_ok = True)
 
-    initializeLogger(LogSeverity.info, logPath.joinpath(logName).with_suffix(".log"), jsonOutput = False)
+    initializeLogger(LogSeverity.info, logPath / _logFileName(), jsonOutput = False)
@@ -17,19 +17,26 @@
 
 from typing import Optional
 from pathlib import Path
+from importlib.metadata import version as getLibraryVersion
+
+import time
+import logging
 
 import click
 
-from ..modules import ui
+from ..modules import ui, cron
 from ..modules import node as node_module
 from ..modules.node import NodeStatus, getNodeStatus
 from ..modules.user import initializeUserSession
-from ..modules.utils import onBeforeCommandExecute, checkEnvironment
+from ..modules.utils import onBeforeCommandExecute, checkEnvironment, clearExecutableCache
 from ..modules.update import activateAutoUpdate
 from ...utils import docker
 from ...configuration import NodeConfiguration, InvalidConfiguration, ConfigurationNotFound
 
 
+UPDATE_CHECK_INTERVAL = 30 * 60  # 30 minutes, same as the cron based update job
+
+
 @click.command()
 @click.option("--image", type = str, help = "Docker image url")
 @onBeforeCommandExecute(node_module.initializeNodeConfiguration)
@@ -141,6 +148,35 @@ def update(autoAccept: bool, autoDecline: bool) -> None:
     activateAutoUpdate()
 
 
+@click.command(hidden = True)
+@click.option("--interval", type = int, default = UPDATE_CHECK_INTERVAL, help = "Seconds between two update checks.")
+@click.pass_context
+def watchUpdates(ctx: click.Context, interval: int) -> None:
+    # Long-running alternative to periodically invoking "coretex node update -n",
+    # interpreter startup and session initialization are paid only once
+    libraryVersion = getLibraryVersion("coretex")
+
+    while True:
+        # Cached values (docker info, crontab, executable paths) are only valid
+        # for a single command invocation, but this process keeps running
+        docker.clearCache()
+        cron.clearCache()
+        clearExecutableCache()
+
+        try:
+            ctx.invoke(update, autoAccept = False, autoDecline = True)
+        except Exception as ex:
+            logging.getLogger("cli").debug(ex, exc_info = ex)
+            ui.errorEcho("Failed to check for Node updates.")
+
+        time.sleep(interval)
+
+        # If the library was upgraded exit so the service manager
+        # restarts the watcher with the new code
+        if getLibraryVersion("coretex") != libraryVersion:
+            return
+
+
 @click.command()
 @click.option("--advanced", is_flag = True, help = "Configure node settings manually.")
 def config(advanced: bool) -> None:
@@ -217,6 +253,7 @@ def node() -> None:
 node.add_command(start, "start")
 node.add_command(stop, "stop")
 node.add_command(update, "update")
+node.add_command(watchUpdates, "watch-updates")
 node.add_command(config, "config")
 node.add_command(status, "status")
 node.add_command(logs, "logs")
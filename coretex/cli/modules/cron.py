@@ -15,35 +15,81 @@
 #     You should have received a copy of the GNU Affero General Public License
 #     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import List
+from typing import Dict, List, Optional
+
+import tempfile
 
 from ...utils import command
 from ...configuration import CONFIG_DIR
 
 
+# Parsed output of "crontab -l", invalidated when scheduleJob installs a new table
+_CRON_CACHE: Optional[List[str]] = None
+
+
+def clearCache() -> None:
+    global _CRON_CACHE
+    _CRON_CACHE = None
+
+
 def getExisting() -> List[str]:
+    global _CRON_CACHE
+
+    if _CRON_CACHE is not None:
+        return list(_CRON_CACHE)
+
     _, output, error = command(["crontab", "-l"], ignoreStdout = True, ignoreStderr = True, check = False)
     if error is not None and "no crontab for" in error:
-        return []
-    if output is not None:
-        return [line.strip() for line in output.split("\n") if line.strip()]
+        _CRON_CACHE = []
+    elif output is not None:
+        _CRON_CACHE = list(filter(None, (line.strip() for line in output.splitlines())))
+    else:
+        raise ValueError("\"crontab\" is not installed. To enable automatic updates please install \"crontab\"")
+
+    return list(_CRON_CACHE)
+
+
+def jobExists(script: str, existing: Optional[List[str]] = None) -> bool:
+    if existing is None:
+        existing = getExisting()
 
-    raise ValueError("\"crontab\" is not installed. To enable automatic updates please install \"crontab\"")
+    return any(script in line for line in existing)
 
 
-def jobExists(script: str) -> bool:
-    existingLines = getExisting()
-    return any(script in line for line in existingLines)
+def jobsExist(scripts: List[str], existing: Optional[List[str]] = None) -> Dict[str, bool]:
+    if existing is None:
+        existing = getExisting()
 
+    return { script: jobExists(script, existing) for script in scripts }
 
-def scheduleJob(scriptName: str) -> None:
-    existingLines = getExisting()
-    cronJob = f"*/30 * * * * {CONFIG_DIR / scriptName} >> {CONFIG_DIR}/logs/ctx_autoupdate.log 2>&1\n"
+
+def scheduleJob(scriptName: str, existing: Optional[List[str]] = None) -> None:
+    global _CRON_CACHE
+
+    existingLines = getExisting() if existing is None else list(existing)
+    cronJob = f"*/30 * * * * {CONFIG_DIR / scriptName} >> {CONFIG_DIR}/logs/ctx_autoupdate.log 2>&1"
     existingLines.append(cronJob)
 
-    tempCronFilePath = CONFIG_DIR / "temp.cron"
-    with tempCronFilePath.open("w") as tempCronFile:
-        tempCronFile.write("\n".join(existingLines))
+    # Temporary file is removed once the context exits, even if crontab fails
+    with tempfile.NamedTemporaryFile("w", suffix = ".cron") as tempCronFile:
+        tempCronFile.writelines(f"{line}\n" for line in existingLines)
+        tempCronFile.flush()
+
+        command(["crontab", tempCronFile.name])
+
+    _CRON_CACHE = existingLines
+
+
+def removeJob(script: str, existing: Optional[List[str]] = None) -> None:
+    global _CRON_CACHE
+
+    existingLines = getExisting() if existing is None else list(existing)
+    remainingLines = [line for line in existingLines if not script in line]
+
+    with tempfile.NamedTemporaryFile("w", suffix = ".cron") as tempCronFile:
+        tempCronFile.writelines(f"{line}\n" for line in remainingLines)
+        tempCronFile.flush()
+
+        command(["crontab", tempCronFile.name])
 
-    command(["crontab", str(tempCronFilePath)])
-    tempCronFilePath.unlink()
+    _CRON_CACHE = remainingLines
@@ -18,6 +18,7 @@
 from typing import Any, Dict, Optional, Tuple
 from enum import Enum
 from pathlib import Path
+from functools import lru_cache
 from base64 import b64encode
 
 import os
@@ -36,6 +37,9 @@ from ...node import NodeMode, NodeStatus
 from ...configuration import config_defaults, NodeConfiguration, InvalidConfiguration, ConfigurationNotFound
 
 
+logger = logging.getLogger("cli")
+
+
 class NodeException(Exception):
     pass
 
@@ -51,8 +55,8 @@ def pull(image: str) -> None:
         ui.progressEcho(f"Fetching image {image}...")
         docker.imagePull(image)
         ui.successEcho(f"Image {image} successfully fetched.")
-    except BaseException as ex:
-        logging.getLogger("cli").debug(ex, exc_info = ex)
+    except Exception as ex:
+        logger.debug(ex, exc_info = ex)
         raise NodeException("Failed to fetch latest node version.")
 
 
@@ -108,8 +112,8 @@ def start(dockerImage: str, nodeConfig: NodeConfiguration) -> None:
         )
 
         ui.successEcho("Successfully started Coretex Node.")
-    except BaseException as ex:
-        logging.getLogger("cli").debug(ex, exc_info = ex)
+    except Exception as ex:
+        logger.debug(ex, exc_info = ex)
         raise NodeException("Failed to start Coretex Node.")
 
 
@@ -117,8 +121,8 @@ def clean() -> None:
     try:
         docker.removeContainer(config_defaults.DOCKER_CONTAINER_NAME)
         docker.removeNetwork(config_defaults.DOCKER_CONTAINER_NETWORK)
-    except BaseException as ex:
-        logging.getLogger("cli").debug(ex, exc_info = ex)
+    except Exception as ex:
+        logger.debug(ex, exc_info = ex)
         raise NodeException("Failed to clean inactive Coretex Node.")
 
 
@@ -142,8 +146,8 @@ def stop(nodeId: Optional[int] = None) -> None:
 
         clean()
         ui.successEcho("Successfully stopped Coretex Node....")
-    except BaseException as ex:
-        logging.getLogger("cli").debug(ex, exc_info = ex)
+    except Exception as ex:
+        logger.debug(ex, exc_info = ex)
         raise NodeException("Failed to stop Coretex Node.")
 
 
@@ -156,28 +160,24 @@ def getNodeStatus() -> NodeStatus:
         return NodeStatus.inactive
 
 
-def getRepoFromImageUrl(image: str) -> str:
-    imageName = image.split("/")[-1]
+@lru_cache(maxsize = 128)
+def _parseImageUrl(image: str) -> Tuple[str, str]:
+    imageName = image.rsplit("/", 1)[-1]
     if not ":" in imageName:
-        return image
+        return image, "latest"
 
     tagIndex = image.rfind(":")
-    if tagIndex != -1:
-        return image[:tagIndex]
-    else:
-        return image
+    return image[:tagIndex], image[tagIndex + 1:]
 
 
-def getTagFromImageUrl(image: str) -> str:
-    imageName = image.split("/")[-1]
-    if not ":" in imageName:
-        return "latest"
+def getRepoFromImageUrl(image: str) -> str:
+    repository, _ = _parseImageUrl(image)
+    return repository
 
-    tagIndex = image.rfind(":")
-    if tagIndex != -1:
-        return image[tagIndex + 1:]
-    else:
-        return "latest"
+
+def getTagFromImageUrl(image: str) -> str:
+    _, tag = _parseImageUrl(image)
+    return tag
 
 
 def shouldUpdate(image: str) -> bool:
@@ -193,11 +193,14 @@ def shouldUpdate(image: str) -> bool:
     except CommandException:
         return False
 
-    for digest in imageJson["RepoDigests"]:
-        if repository in digest and manifestJson["Descriptor"]["digest"] in digest:
-            return False
+    # RepoDigests entries are in "repository@digest" format
+    localDigests = set()
+    for repoDigest in imageJson["RepoDigests"]:
+        digestRepository, separator, digest = repoDigest.partition("@")
+        if separator and repository in digestRepository:
+            localDigests.add(digest)
 
-    return True
+    return manifestJson["Descriptor"]["digest"] not in localDigests
 
 
 def showLogs(tail: Optional[int], follow: bool, timestamps: bool) -> None:
@@ -0,0 +1,110 @@
+#     Copyright (C) 2023  Coretex LLC
+
+#     This file is part of Coretex.ai
+
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU Affero General Public License as
+#     published by the Free Software Foundation, either version 3 of the
+#     License, or (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU Affero General Public License for more details.
+
+#     You should have received a copy of the GNU Affero General Public License
+#     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from pathlib import Path
+
+import os
+import shutil
+
+from ...utils import command
+
+
+SERVICE_DIR = Path.home().joinpath(".config", "systemd", "user")
+
+
+def _systemctl(*args: str, check: bool = True) -> int:
+    returnCode, _, _ = command(["systemctl", "--user", *args], ignoreStdout = True, ignoreStderr = True, check = check)
+    return returnCode
+
+
+def isAvailable() -> bool:
+    # /run/systemd/system only exists if systemd is the running init system
+    if shutil.which("systemctl") is None or not Path("/run/systemd/system").exists():
+        return False
+
+    # User manager is not reachable without a user session (e.g. when running with sudo)
+    return _systemctl("show-environment", check = False) == 0
+
+
+def isLingerEnabled() -> bool:
+    # Without lingering user services are stopped once the user logs out
+    if shutil.which("loginctl") is None:
+        return False
+
+    _, output, _ = command(
+        ["loginctl", "show-user", str(os.getuid()), "--property", "Linger"],
+        ignoreStdout = True,
+        ignoreStderr = True,
+        check = False
+    )
+
+    return "Linger=yes" in output
+
+
+def enableLinger() -> bool:
+    """
+        Enables lingering for the current user if it is not already enabled
+
+        Returns
+        -------
+        bool -> True if lingering is enabled, False if it could not be enabled
+    """
+
+    if isLingerEnabled():
+        return True
+
+    if shutil.which("loginctl") is None:
+        return False
+
+    # Can be denied by the system policy
+    command(["loginctl", "enable-linger"], ignoreStdout = True, ignoreStderr = True, check = False)
+    return isLingerEnabled()
+
+
+def isServiceCurrent(serviceName: str, content: str) -> bool:
+    servicePath = SERVICE_DIR / serviceName
+    if not servicePath.exists() or servicePath.read_text() != content:
+        return False
+
+    return _systemctl("is-enabled", serviceName, check = False) == 0 and _systemctl("is-active", serviceName, check = False) == 0
+
+
+def enableService(serviceName: str, content: str) -> None:
+    """
+        Installs, enables and (re)starts the user service
+
+        Raises
+        ------
+        CommandException -> if any of the systemctl commands failed
+    """
+
+    SERVICE_DIR.mkdir(parents = True, exist_ok = True)
+    (SERVICE_DIR / serviceName).write_text(content)
+
+    _systemctl("daemon-reload")
+    _systemctl("enable", serviceName)
+
+    # Restart starts the service if it is not running, or makes an
+    # already running service pick up the changed unit file
+    _systemctl("restart", serviceName)
+
+
+def disableService(serviceName: str) -> None:
+    # Stops the service and removes it from autostart, failures are ignored
+    # since the service may not be installed or loaded at all
+    if (SERVICE_DIR / serviceName).exists():
+        _systemctl("disable", "--now", serviceName, check = False)
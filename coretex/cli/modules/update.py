@@ -18,16 +18,19 @@
 from enum import IntEnum
 from pathlib import Path
 
+import logging
+
 import requests
 
+from . import cron, systemd
 from .utils import getExecPath
-from .cron import jobExists, scheduleJob
 from ..resources import RESOURCES_DIR
-from ...utils import command
+from ...utils import command, CommandException
 from ...configuration import DEFAULT_VENV_PATH
 
 
 UPDATE_SCRIPT_NAME = "update_node.sh"
+UPDATE_SERVICE_NAME = "coretex-node-update.service"
 
 
 class NodeStatus(IntEnum):
@@ -54,6 +57,19 @@ def generateUpdateScript() -> str:
     )
 
 
+def generateUpdateService() -> str:
+    serviceTemplatePath = RESOURCES_DIR / "update_service_template.service"
+
+    with serviceTemplatePath.open("r") as serviceFile:
+        serviceTemplate = serviceFile.read()
+
+    return serviceTemplate.format(
+        dockerPath = getExecPath("docker"),
+        gitPath = getExecPath("git"),
+        venvPath = DEFAULT_VENV_PATH
+    )
+
+
 def dumpScript(updateScriptPath: Path) -> None:
     with updateScriptPath.open("w") as scriptFile:
         scriptFile.write(generateUpdateScript())
@@ -61,9 +77,45 @@ def dumpScript(updateScriptPath: Path) -> None:
     command(["chmod", "+x", str(updateScriptPath)], ignoreStdout = True)
 
 
+def _activateUpdateService() -> bool:
+    # Without lingering the service stops once the user logs out, so cron job
+    # is used instead. Service must not keep running next to the cron job
+    # since both of them can restart the same node container
+    if not systemd.enableLinger():
+        systemd.disableService(UPDATE_SERVICE_NAME)
+        return False
+
+    serviceContent = generateUpdateService()
+
+    try:
+        if not systemd.isServiceCurrent(UPDATE_SERVICE_NAME, serviceContent):
+            systemd.enableService(UPDATE_SERVICE_NAME, serviceContent)
+    except (CommandException, OSError) as ex:
+        logging.getLogger("cli").debug(ex, exc_info = ex)
+
+        systemd.disableService(UPDATE_SERVICE_NAME)
+        return False
+
+    return True
+
+
 def activateAutoUpdate() -> None:
     updateScriptPath = DEFAULT_VENV_PATH.parent / UPDATE_SCRIPT_NAME
+
+    # Prefer a long-lived systemd service over a cron job which has to
+    # start a new python interpreter every time the update check runs
+    if systemd.isAvailable() and _activateUpdateService():
+        try:
+            if cron.jobExists(str(updateScriptPath)):
+                cron.removeJob(str(updateScriptPath))
+        except (ValueError, FileNotFoundError):
+            # crontab is not installed so there is no old job to remove
+            pass
+
+        return
+
     dumpScript(updateScriptPath)
 
-    if not jobExists(str(updateScriptPath)):
-        scheduleJob(UPDATE_SCRIPT_NAME)
+    existing = cron.getExisting()
+    if not cron.jobExists(str(updateScriptPath), existing):
+        cron.scheduleJob(UPDATE_SCRIPT_NAME, existing)
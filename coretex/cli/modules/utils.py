@@ -17,9 +17,10 @@
 
 from typing import List, Any, Tuple, Optional, Callable
 from pathlib import Path
-from functools import wraps
+from functools import wraps, lru_cache
 from importlib.metadata import version as getLibraryVersion
 
+import os
 import sys
 import venv
 import shutil
@@ -149,12 +150,22 @@ def checkLibVersion() -> None:
         ui.stdEcho("Use \"coretex update\" command to update library to latest version.")
 
 
+@lru_cache(maxsize = None)
+def _findExecutable(executable: str, searchPath: Optional[str]) -> Optional[str]:
+    return shutil.which(executable, path = searchPath)
+
+
+def clearExecutableCache() -> None:
+    _findExecutable.cache_clear()
+
+
 def getExecPath(executable: str) -> str:
-    _, path, _ = command(["which", executable], ignoreStdout = True, ignoreStderr = True)
-    pathParts = path.strip().split('/')
-    execPath = '/'.join(pathParts[:-1])
+    # Resolved paths are cached per PATH value, so changes to PATH are respected
+    path = _findExecutable(executable, os.environ.get("PATH"))
+    if path is None:
+        raise FileNotFoundError(f"Failed to find \"{executable}\" executable")
 
-    return execPath
+    return str(Path(path).parent)
 
 
 def isGPUAvailable() -> bool:
@@ -29,8 +29,7 @@ from ..utils import isCliRuntime
 
 
 def configMigration(configPath: Path) -> None:
-    with configPath.open("r") as file:
-        oldConfig = json.load(file)
+    oldConfig = json.loads(configPath.read_bytes())
 
     UserConfiguration({
         "username": oldConfig.get("username"),
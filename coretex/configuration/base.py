@@ -30,6 +30,26 @@ CONFIG_DIR = Path.home().joinpath(".config", "coretex")
 DEFAULT_VENV_PATH = CONFIG_DIR / "venv"
 
 
+# Parsed configuration files, stored together with the modification
+# time and size of the file at the moment it was parsed
+_CONFIG_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _readConfig(configPath: Path) -> Dict[str, Any]:
+    # mtime alone can miss a rewrite on filesystems with coarse timestamps,
+    # so the size is compared as well
+    stat = configPath.stat()
+    fileState = stat.st_mtime_ns, stat.st_size
+
+    cached = _CONFIG_CACHE.get(configPath)
+    if cached is None or cached[0] != fileState:
+        cached = fileState, json.loads(configPath.read_bytes())
+        _CONFIG_CACHE[configPath] = cached
+
+    # Configuration objects modify their raw values, so a copy is returned
+    return dict(cached[1])
+
+
 class InvalidConfiguration(Exception):
 
     def __init__(self, message: str, errors: List[str]) -> None:
@@ -62,8 +82,7 @@ class BaseConfiguration:
         if not configPath.exists():
             raise ConfigurationNotFound(f"Configuration not found at path: {configPath}")
 
-        with configPath.open("r") as file:
-            raw = json.load(file)
+        raw = _readConfig(configPath)
 
         config = cls(raw)
 
@@ -104,8 +123,9 @@ class BaseConfiguration:
         if not configPath.parent.exists():
             configPath.parent.mkdir(parents = True, exist_ok = True)
 
-        with configPath.open("w") as configFile:
-            json.dump(self._raw, configFile, indent = 4)
+        # json.dump issues a separate write for every encoded chunk,
+        # encoding to a string first writes the file in a single call
+        configPath.write_text(json.dumps(self._raw, indent = 4))
 
     def update(self, config: Self) -> None:
         self._raw = config._raw
@@ -25,6 +25,13 @@ from ..node import NodeMode
 from ..networking import networkManager, NetworkRequestError
 
 
+REQUIRED_FIELDS: List[Tuple[str, type]] = [
+    ("name", str),
+    ("image", str),
+    ("accessToken", str)
+]
+
+
 class NodeConfiguration(BaseConfiguration):
 
     @classmethod
@@ -211,17 +218,10 @@ class NodeConfiguration(BaseConfiguration):
         cpuLimit, ramLimit = docker.getResourceLimits()
         swapLimit = docker.getDockerSwapLimit()
 
-        if not isinstance(self._raw.get("name"), str):
-            isValid = False
-            errorMessages.append("Invalid configuration. Missing required field \"name\".")
-
-        if not isinstance(self._raw.get("image"), str):
-            isValid = False
-            errorMessages.append("Invalid configuration. Missing required field \"image\".")
-
-        if not isinstance(self._raw.get("accessToken"), str):
-            isValid = False
-            errorMessages.append("Invalid configuration. Missing required field \"accessToken\".")
+        for key, valueType in REQUIRED_FIELDS:
+            if not isinstance(self._raw.get(key), valueType):
+                isValid = False
+                errorMessages.append(f"Invalid configuration. Missing required field \"{key}\".")
 
         validateRamField = utils.validateRamField(self, ramLimit)
         if isinstance(validateRamField, tuple):
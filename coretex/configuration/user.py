@@ -25,6 +25,12 @@ from .base import BaseConfiguration, CONFIG_DIR
 from ..utils import decodeDate
 
 
+REQUIRED_FIELDS: List[Tuple[str, type]] = [
+    ("username", str),
+    ("password", str)
+]
+
+
 class UserConfiguration(BaseConfiguration):
 
     @classmethod
@@ -108,13 +114,10 @@ class UserConfiguration(BaseConfiguration):
         isValid = True
         errorMessages = []
 
-        if self._raw.get("username") is None or not isinstance(self._raw.get("username"), str):
-            isValid = False
-            errorMessages.append("Missing required field \"username\" in user configuration.")
-
-        if self._raw.get("password") is None or not isinstance(self._raw.get("password"), str):
-            isValid = False
-            errorMessages.append("Missing required field \"password\" in user configuration.")
+        for key, valueType in REQUIRED_FIELDS:
+            if not isinstance(self._raw.get(key), valueType):
+                isValid = False
+                errorMessages.append(f"Missing required field \"{key}\" in user configuration.")
 
         return isValid, errorMessages
 
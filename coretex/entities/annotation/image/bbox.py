@@ -17,6 +17,9 @@
 
 from typing import List, Dict, Optional, Tuple, Union
 from typing_extensions import Self
+from itertools import chain
+
+import numpy as np
 
 from ....codable import Codable, KeyDescriptor
 
@@ -144,17 +147,56 @@ class BBox(Codable):
             "minX: 0, minY: 0, width: 4, height: 3"
         """
 
-        x: List[int] = []
-        y: List[int] = []
-
-        for index, value in enumerate(polygon):
-            if index % 2 == 0:
-                x.append(value)
-            else:
-                y.append(value)
+        x = polygon[0::2]
+        y = polygon[1::2]
 
         return cls.create(min(x), min(y), max(x), max(y))
 
+    @classmethod
+    def fromPolys(cls, polygons: List[List[float]]) -> np.ndarray:
+        """
+            Calculates bounding boxes for multiple polygons in a single
+            vectorized pass, polygons can have different number of points
+
+            Parameters
+            ----------
+            polygons : List[List[float]]
+                list of polygons, each represented as a list of x, y points - length must be even
+
+            Returns
+            -------
+            np.ndarray -> array of shape (N, 4) where each row
+            contains minX, minY, width and height of a bounding box
+
+            Raises
+            ------
+            ValueError -> if any of the polygons is empty or has an odd number of values
+
+            Example
+            -------
+            >>> from coretex import BBox
+            \b
+            >>> polygons = [[0, 0, 0, 3, 4, 3, 4, 0], [1, 1, 2, 5, 6, 2]]
+            >>> bboxes = [BBox(*row) for row in BBox.fromPolys(polygons).tolist()]
+        """
+
+        if len(polygons) == 0:
+            return np.empty((0, 4), dtype = np.float32)
+
+        lengths = np.fromiter((len(polygon) for polygon in polygons), dtype = np.int64, count = len(polygons))
+        if np.any(lengths == 0) or np.any(lengths % 2 != 0):
+            raise ValueError("Polygons must contain an even number of values greater than zero")
+
+        pointCounts = lengths // 2
+        offsets = np.cumsum(pointCounts) - pointCounts
+
+        points = np.fromiter(chain.from_iterable(polygons), dtype = np.float32, count = int(lengths.sum())).reshape(-1, 2)
+
+        minimums = np.minimum.reduceat(points, offsets, axis = 0)
+        maximums = np.maximum.reduceat(points, offsets, axis = 0)
+
+        return np.concatenate([minimums, maximums - minimums], axis = 1)
+
     def iou(self, other: 'BBox') -> float:
         """
             Calculate Intersection over Union (IoU) between two bounding boxes
@@ -222,6 +222,37 @@ class ImageDatasetClasses(List[ImageDatasetClass]):
         except ValueError:
             return None
 
+    def labelIdsByClassId(self) -> Dict[str, int]:
+        """
+            Maps every class ID to its label ID, same as calling
+            labelIdForClassId for each class ID, but labels are sorted only once
+
+            Returns
+            -------
+            Dict[str, int] -> label ID for each class ID (as string),
+            if a class ID belongs to multiple classes the first class is used
+
+            Example
+            -------
+            >>> from coretex import ImageDataset
+            \b
+            >>> dataset = ImageDataset.fetchById(1023)
+            >>> labelIds = dataset.classes.labelIdsByClassId()
+            >>> print(labelIds["d710019b-f28f-40ab-aa65-e13df949beff"])
+            1
+        """
+
+        labels = self.labels
+        labelIds: Dict[str, int] = {}
+
+        for element in self:
+            labelId = labels.index(element.label)
+
+            for classId in element.classIds:
+                labelIds.setdefault(str(classId), labelId)
+
+        return labelIds
+
     def labelIdForClass(self, clazz: ImageDatasetClass) -> Optional[int]:
         """
             Retrieves a label ID based on provided ImageDatasetClass object
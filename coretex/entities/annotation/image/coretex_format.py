@@ -33,12 +33,30 @@ SegmentationType = List[int]
 
 
 def toPoly(segmentation: List[int]) -> List[Tuple[int, int]]:
-    points: List[Tuple[int, int]] = []
+    # Deprecated: PIL accepts flat [x0, y0, x1, y1, ...] sequences directly,
+    # kept for backwards compatibility only
+    return list(zip(segmentation[0::2], segmentation[1::2]))
 
-    for index in range(0, len(segmentation) - 1, 2):
-        points.append((segmentation[index], segmentation[index + 1]))
 
-    return points
+def _packSegmentations(segmentations: List[SegmentationType]) -> Tuple[np.ndarray, np.ndarray]:
+    # Stores points of all polygons in a single (N, 2) array, polygon
+    # boundaries are stored as offsets (in points) into that array
+    # Empty polygons are skipped since np.asarray([]) is float64
+    # and would promote integer coordinates of other polygons to float
+    arrays = [np.asarray(segmentation) for segmentation in segmentations if len(segmentation) > 0]
+
+    if len(arrays) == 0:
+        points = np.empty((0, 2), dtype = np.int64)
+    else:
+        points = np.concatenate(arrays).reshape(-1, 2)
+
+    offsets = np.cumsum([len(segmentation) // 2 for segmentation in segmentations])[:-1]
+
+    return points, offsets
+
+
+def _unpackSegmentations(points: np.ndarray, offsets: np.ndarray) -> List[SegmentationType]:
+    return [polygon.ravel().tolist() for polygon in np.split(points, offsets)]
 
 
 class CoretexSegmentationInstance(Codable):
@@ -120,13 +138,13 @@ class CoretexSegmentationInstance(Codable):
         """
 
         image = Image.new("L", (width, height))
+        draw = ImageDraw.Draw(image)
 
         for segmentation in self.segmentations:
             if len(segmentation) < 4:
                 raise ValueError(f">> [Coretex] Segmentation has too few values ({len(segmentation)}. Minimum: 4)")
 
-            draw = ImageDraw.Draw(image)
-            draw.polygon(toPoly(segmentation), fill = 1)
+            draw.polygon(segmentation, fill = 1)
 
         return np.array(image)
 
@@ -147,10 +165,9 @@ class CoretexSegmentationInstance(Codable):
             np.ndarray -> binary segmentation mask represented as np.ndarray
         """
 
-        binaryMask = self.extractSegmentationMask(width, height)
-        binaryMask[binaryMask > 0] = 1
-
-        return binaryMask
+        # All polygons are drawn with fill value 1, so
+        # segmentation mask is already a binary mask
+        return self.extractSegmentationMask(width, height)
 
     def centroid(self) -> Tuple[int, int]:
         """
@@ -161,15 +178,11 @@ class CoretexSegmentationInstance(Codable):
             Tuple[int, int] -> x, y coordinates of centroid
         """
 
-        flattenedSegmentations = [element for sublist in self.segmentations for element in sublist]
-
-        listCX = [value for index, value in enumerate(flattenedSegmentations) if index % 2 == 0]
-        centerX = sum(listCX) // len(listCX)
-
-        listCY = [value for index, value in enumerate(flattenedSegmentations) if index % 2 != 0]
-        centerY = sum(listCY) // len(listCY)
+        points, _ = _packSegmentations(self.segmentations)
+        sumX, sumY = points.sum(axis = 0).tolist()
 
-        return centerX, centerY
+        # Raises ZeroDivisionError if there are no points
+        return sumX // len(points), sumY // len(points)
 
     def centerSegmentations(self, newCentroid: Tuple[int, int]) -> None:
         """
@@ -184,21 +197,14 @@ class CoretexSegmentationInstance(Codable):
         newCenterX, newCenterY = newCentroid
         oldCenterX, oldCenterY = self.centroid()
 
-        modifiedSegmentations: List[List[int]] = []
-
-        for segmentation in self.segmentations:
-            modifiedSegmentation: List[int] = []
+        # All points of all polygons are moved with a single broadcast add
+        points, offsets = _packSegmentations(self.segmentations)
+        if len(points) == 0:
+            return
 
-            for i in range(0, len(segmentation), 2):
-                x = segmentation[i] + (newCenterX - oldCenterX)
-                y = segmentation[i+1] + (newCenterY - oldCenterY)
+        delta = np.array([newCenterX - oldCenterX, newCenterY - oldCenterY])
 
-                modifiedSegmentation.append(x)
-                modifiedSegmentation.append(y)
-
-            modifiedSegmentations.append(modifiedSegmentation)
-
-        self.segmentations = modifiedSegmentations
+        self.segmentations = _unpackSegmentations(points + delta, offsets)
 
     def rotateSegmentations(
         self,
@@ -218,7 +224,6 @@ class CoretexSegmentationInstance(Codable):
         if origin is None:
             origin = self.centroid()
 
-        rotatedSegmentations: List[List[int]] = []
         centerX, centerY = origin
 
         # because rotations with image and segmentations doesn't go in same direction
@@ -226,22 +231,28 @@ class CoretexSegmentationInstance(Codable):
         theta = radians(-degrees)
         cosang, sinang = cos(theta), sin(theta)
 
-        for segmentation in self.segmentations:
-            rotatedSegmentation: List[int] = []
+        # All polygons are rotated at once
+        points, offsets = _packSegmentations(self.segmentations)
+        if len(points) == 0:
+            return
 
-            for i in range(0, len(segmentation), 2):
-                x = segmentation[i] - centerX
-                y = segmentation[i + 1] - centerY
+        x = points[:, 0] - centerX
+        y = points[:, 1] - centerY
 
-                newX = int(x * cosang - y * sinang) + centerX
-                newY = int(x * sinang + y * cosang) + centerY
+        # Rotated offsets are truncated towards zero before moving them back to origin,
+        # origin is added per axis so each coordinate keeps the type of its origin value
+        rotatedX = np.trunc(x * cosang - y * sinang).astype(np.int64) + centerX
+        rotatedY = np.trunc(x * sinang + y * cosang).astype(np.int64) + centerY
 
-                rotatedSegmentation.append(newX)
-                rotatedSegmentation.append(newY)
+        if rotatedX.dtype == rotatedY.dtype:
+            rotated = np.stack([rotatedX, rotatedY], axis = 1)
+        else:
+            # Mixed int/float origin, e.g. (10.5, 3)
+            rotated = np.empty((len(points), 2), dtype = object)
+            rotated[:, 0] = rotatedX.tolist()
+            rotated[:, 1] = rotatedY.tolist()
 
-            rotatedSegmentations.append(rotatedSegmentation)
-
-        self.segmentations = rotatedSegmentations
+        self.segmentations = _unpackSegmentations(rotated, offsets)
 
 
 class CoretexImageAnnotation(Codable):
@@ -323,10 +334,16 @@ class CoretexImageAnnotation(Codable):
             np.ndarray -> segmentation mask represented as np.ndarray
         """
 
-        image = Image.new("L", (self.width, self.height))
+        # Polygons are collected and validated before drawing so the
+        # drawing loop only rasterizes, order of instances is preserved
+        # since later instances overwrite earlier ones where they overlap
+        polygons: List[Tuple[SegmentationType, int]] = []
+
+        # Label IDs are resolved once per class instead of once per instance
+        labelIds = classes.labelIdsByClassId()
 
         for instance in self.instances:
-            labelId = classes.labelIdForClassId(instance.classId)
+            labelId = labelIds.get(str(instance.classId))
             if labelId is None:
                 continue
 
@@ -334,7 +351,12 @@ class CoretexImageAnnotation(Codable):
                 if len(segmentation) < 4:
                     raise ValueError(f">> [Coretex] Segmentation has too few values ({len(segmentation)}. Minimum: 4)")
 
-                draw = ImageDraw.Draw(image)
-                draw.polygon(toPoly(segmentation), fill = labelId + 1)
+                polygons.append((segmentation, labelId + 1))
+
+        image = Image.new("L", (self.width, self.height))
+        draw = ImageDraw.Draw(image)
+
+        for segmentation, fill in polygons:
+            draw.polygon(segmentation, fill = fill)
 
         return np.asarray(image)
@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+from typing import Dict
 from enum import IntEnum
 
 import logging
@@ -43,22 +44,11 @@ class LogSeverity(IntEnum):
             str -> color
         """
 
-        if self == LogSeverity.fatal:
-            return 31  # red
+        color = _COLORS.get(self)
+        if color is None:
+            raise RuntimeError(">> [Coretex] Invalid enum value")
 
-        if self == LogSeverity.error:
-            return 31  # red
-
-        if self == LogSeverity.warning:
-            return 33  # yellow
-
-        if self == LogSeverity.info:
-            return 97  # white
-
-        if self == LogSeverity.debug:
-            return 33  # yellow
-
-        raise RuntimeError(">> [Coretex] Invalid enum value")
+        return color
 
     def getLevel(self) -> int:
         """
@@ -77,22 +67,11 @@ class LogSeverity(IntEnum):
             20
         """
 
-        if self == LogSeverity.fatal:
-            return logging.FATAL
-
-        if self == LogSeverity.error:
-            return logging.ERROR
-
-        if self == LogSeverity.warning:
-            return logging.WARNING
-
-        if self == LogSeverity.info:
-            return logging.INFO
-
-        if self == LogSeverity.debug:
-            return logging.DEBUG
+        level = _LEVELS.get(self)
+        if level is None:
+            raise RuntimeError(">> [Coretex] Invalid enum value")
 
-        raise RuntimeError(">> [Coretex] Invalid enum value")
+        return level
 
     @property
     def prefix(self) -> str:
@@ -126,19 +105,27 @@ class LogSeverity(IntEnum):
             LogSeverity.info
         """
 
-        if logLevel == logging.FATAL:
-            return LogSeverity.fatal
+        severity = _SEVERITIES.get(logLevel)
+        if severity is None:
+            raise ValueError(">> [Coretex] Invalid enum value")
 
-        if logLevel == logging.ERROR:
-            return LogSeverity.error
+        return severity
 
-        if logLevel == logging.WARNING:
-            return LogSeverity.warning
 
-        if logLevel == logging.INFO:
-            return LogSeverity.info
+_COLORS: Dict[LogSeverity, int] = {
+    LogSeverity.fatal:   31,  # red
+    LogSeverity.error:   31,  # red
+    LogSeverity.warning: 33,  # yellow
+    LogSeverity.info:    97,  # white
+    LogSeverity.debug:   33   # yellow
+}
 
-        if logLevel == logging.DEBUG:
-            return LogSeverity.debug
+_LEVELS: Dict[LogSeverity, int] = {
+    LogSeverity.fatal:   logging.FATAL,
+    LogSeverity.error:   logging.ERROR,
+    LogSeverity.warning: logging.WARNING,
+    LogSeverity.info:    logging.INFO,
+    LogSeverity.debug:   logging.DEBUG
+}
 
-        raise ValueError(">> [Coretex] Invalid enum value")
+_SEVERITIES: Dict[int, LogSeverity] = {level: severity for severity, level in _LEVELS.items()}
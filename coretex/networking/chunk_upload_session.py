@@ -17,7 +17,9 @@
 
 from typing import Union
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import mmap
 import logging
 
 from .network_manager_base import FileData
@@ -25,13 +27,9 @@ from .network_manager import networkManager
 from .network_response import NetworkRequestError
 
 
-MAX_CHUNK_SIZE = 128 * 1024 * 1024  # 128 MiB
-
+logger = logging.getLogger("coretexpylib")
 
-def _loadChunk(filePath: Path, start: int, chunkSize: int) -> bytes:
-    with filePath.open("rb") as file:
-        file.seek(start)
-        return file.read(chunkSize)
+MAX_CHUNK_SIZE = 128 * 1024 * 1024  # 128 MiB
 
 
 class ChunkUploadSession:
@@ -53,18 +51,26 @@ class ChunkUploadSession:
             path to the file which will be uploaded
         fileSize : int
             size of the file which will be uploaded
+        maxWorkers : int
+            number of chunks which are uploaded in parallel, defaults to 1.
+            With more than 1 worker chunks can arrive to the server out of
+            order, and every worker holds a whole chunk request in memory
     """
 
-    def __init__(self, chunkSize: int, filePath: Union[Path, str]) -> None:
+    def __init__(self, chunkSize: int, filePath: Union[Path, str], maxWorkers: int = 1) -> None:
         if chunkSize <= 0 or chunkSize > MAX_CHUNK_SIZE:
             raise ValueError(f">> [Coretex] Invalid \"chunkSize\" value \"{chunkSize}\". Value must be in range 0-{MAX_CHUNK_SIZE}")
 
+        if maxWorkers <= 0:
+            raise ValueError(f">> [Coretex] Invalid \"maxWorkers\" value \"{maxWorkers}\". Value must be greater than 0")
+
         if isinstance(filePath, str):
             filePath = Path(filePath)
 
         self.chunkSize = chunkSize
         self.filePath = filePath
         self.fileSize = filePath.lstat().st_size
+        self.maxWorkers = maxWorkers
 
     def __start(self) -> str:
         parameters = {
@@ -82,23 +88,28 @@ class ChunkUploadSession:
 
         return uploadId
 
-    def __uploadChunk(self, uploadId: str, start: int, end: int) -> None:
+    def __uploadChunk(self, mappedFile: mmap.mmap, uploadId: str, start: int, end: int) -> None:
         parameters = {
             "id": uploadId,
             "start": start,
             "end": end - 1  # API expects start/end to be inclusive
         }
 
-        chunk = _loadChunk(self.filePath, start, self.chunkSize)
-        files = [
-            FileData.createFromBytes("file", chunk, self.filePath.name)
-        ]
+        # Slicing memory mapped file does not depend on the file position
+        # so it is safe to do from multiple upload threads at the same time.
+        # Chunk is a view into the mapped file instead of a copy of its bytes,
+        # views have to be released before the mapped file can be closed
+        with memoryview(mappedFile) as view, view[start:end] as chunk:
+            files = [
+                FileData.createFromBytes("file", chunk, self.filePath.name)
+            ]
+
+            response = networkManager.formData("upload/chunk", parameters, files)
 
-        response = networkManager.formData("upload/chunk", parameters, files)
         if response.hasFailed():
             raise NetworkRequestError(response, f"Failed to upload file chunk with byte range \"{start}-{end}\"")
 
-        logging.getLogger("coretexpylib").debug(f">> [Coretex] Uploaded chunk with range \"{start}-{end}\"")
+        logger.debug(f">> [Coretex] Uploaded chunk with range \"{start}-{end}\"")
 
     def run(self) -> str:
         """
@@ -126,19 +137,38 @@ class ChunkUploadSession:
                 except NetworkRequestError, ValueError:
                     print("Failed to upload file")
         """
-        logging.getLogger("coretexpylib").debug(f">> [Coretex] Starting upload for \"{self.filePath}\"")
+        logger.debug(f">> [Coretex] Starting upload for \"{self.filePath}\"")
 
         uploadId = self.__start()
 
-        chunkCount = self.fileSize // self.chunkSize
-        if self.fileSize % self.chunkSize != 0:
-            chunkCount += 1
+        if self.fileSize == 0:
+            # Empty files cannot be memory mapped, and there is nothing to upload
+            return uploadId
+
+        # Ceiling division, last chunk can be smaller than chunk size
+        chunkCount = (self.fileSize + self.chunkSize - 1) // self.chunkSize
+
+        with self.filePath.open("rb") as file, \
+            mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ) as mappedFile, \
+            ThreadPoolExecutor(max_workers = self.maxWorkers) as executor:
+
+            futures = []
+
+            for i in range(chunkCount):
+                start = i * self.chunkSize
+                end = min(start + self.chunkSize, self.fileSize)
+
+                futures.append(executor.submit(self.__uploadChunk, mappedFile, uploadId, start, end))
 
-        for i in range(chunkCount):
-            start = i * self.chunkSize
-            end = min(start + self.chunkSize, self.fileSize)
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                # Do not start uploading remaining chunks if one of the chunks failed
+                for future in futures:
+                    future.cancel()
 
-            self.__uploadChunk(uploadId, start, end)
+                raise
 
         return uploadId
 
@@ -48,7 +48,7 @@ class FileData:
             Mime type of the file which will be uploaded
         filePath : Optional[str]
             Path to the file which will be uploaded
-        fileBytes : Optional[bytes]
+        fileBytes : Optional[Union[bytes, memoryview]]
             Bytes of the file which will be uploaded
     """
 
@@ -58,7 +58,7 @@ class FileData:
         fileName: str,
         mimeType: str,
         filePath: Optional[Path] = None,
-        fileBytes: Optional[bytes] = None
+        fileBytes: Optional[Union[bytes, memoryview]] = None
     ) -> None:
 
         if filePath is None and fileBytes is None:
@@ -124,7 +124,7 @@ class FileData:
     def createFromBytes(
         cls,
         parameterName: str,
-        fileBytes: bytes,
+        fileBytes: Union[bytes, memoryview],
         fileName: str,
         mimeType: Optional[str] = None
     ) -> Self:
@@ -137,7 +137,7 @@ class FileData:
             ----------
             parameterName : str
                 Name of the form-data parameter
-            fileBytes : bytes
+            fileBytes : Union[bytes, memoryview]
                 Bytes of the file which will be uploaded
             fileName : str
                 Name of the file which will be uploaded, if None it will
@@ -156,7 +156,7 @@ class FileData:
 
         return cls(parameterName, fileName, mimeType, fileBytes = fileBytes)
 
-    def __getFileData(self, exitStack: ExitStack) -> Union[bytes, BinaryIO]:
+    def __getFileData(self, exitStack: ExitStack) -> Union[bytes, memoryview, BinaryIO]:
         if self.fileBytes is not None:
             return self.fileBytes
 
@@ -165,7 +165,7 @@ class FileData:
 
         raise ValueError(">> [Coretex] Either \"filePath\" or \"fileData\" have to provided for file upload. \"fileData\" will be used if both are provided")
 
-    def prepareForUpload(self, exitStack: ExitStack) -> Tuple[str, Tuple[str, Union[bytes, BinaryIO], str]]:
+    def prepareForUpload(self, exitStack: ExitStack) -> Tuple[str, Tuple[str, Union[bytes, memoryview, BinaryIO], str]]:
         """
             Converts the "FileData" object into a format which can be used
             by the requests library for uploading files.
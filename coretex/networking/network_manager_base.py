@@ -21,9 +21,12 @@ from abc import ABC, abstractmethod
 from contextlib import ExitStack
 from http import HTTPStatus
 from importlib.metadata import version as getLibraryVersion
+from functools import lru_cache
+from threading import Lock
 
 import os
 import json
+import gzip
 import logging
 import platform
 
@@ -61,6 +64,15 @@ RETRY_STATUS_CODES = [
 ]
 
 DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MB
+MIN_COMPRESSION_SIZE = 1024  # 1 KB, smaller bodies are not worth compressing
+
+
+@lru_cache(maxsize = 1)
+def _userAgent() -> str:
+    # Library and python versions do not change while the process is running,
+    # looking up package metadata hits the filesystem so it is done only once
+    coretexpylibVersion = getLibraryVersion("coretex")
+    return f"coretexpylib;{coretexpylibVersion};python;{platform.python_version()}"
 
 
 class RequestFailedError(Exception):
@@ -83,6 +95,10 @@ class NetworkManagerBase(ABC):
         self._session.mount("http://", adapter)
         self._session.mount("https://", adapter)
 
+        # Used to make sure that only one thread refreshes the API token
+        # when multiple concurrent requests fail with unauthorized
+        self._refreshLock = Lock()
+
     @property
     def serverUrl(self) -> str:
         return os.environ["CTX_API_URL"] + "api/v1/"
@@ -109,8 +125,7 @@ class NetworkManagerBase(ABC):
 
     @property
     def userAgent(self) -> str:
-        coretexpylibVersion = getLibraryVersion("coretex")
-        return f"coretexpylib;{coretexpylibVersion};python;{platform.python_version()}"
+        return _userAgent()
 
     @property
     def hasStoredCredentials(self) -> bool:
@@ -136,7 +151,7 @@ class NetworkManagerBase(ABC):
 
         return headers
 
-    def shouldRetry(self, retryCount: int, response: Optional[NetworkResponse]) -> bool:
+    def shouldRetry(self, retryCount: int, response: Optional[NetworkResponse], sentApiToken: Optional[str] = None) -> bool:
         """
             Checks if network request should be repeated based on the number of repetitions
             as well as the response from previous repetition
@@ -147,6 +162,9 @@ class NetworkManagerBase(ABC):
                 number of repeated function calls
             response : Optional[NetworkResponse]
                 response of the request which is pending for retry
+            sentApiToken : Optional[str]
+                API token with which the request was sent, used to avoid refreshing
+                the token if it was already refreshed by another request
 
             Returns
             -------
@@ -161,8 +179,14 @@ class NetworkManagerBase(ABC):
             # If we get unauthorized maybe API token is expired
             # If refresh endpoint failed with unauthorized do not retry
             if response.isUnauthorized() and response.endpoint != REFRESH_ENDPOINT:
-                refreshTokenResponse = self.refreshToken()
-                return not refreshTokenResponse.hasFailed()
+                with self._refreshLock:
+                    # If the token was refreshed by another request while this
+                    # one was in flight retry with the new token
+                    if sentApiToken is not None and sentApiToken != self._apiToken:
+                        return True
+
+                    refreshTokenResponse = self.refreshToken()
+                    return not refreshTokenResponse.hasFailed()
 
             return response.statusCode in RETRY_STATUS_CODES
 
@@ -180,7 +204,8 @@ class NetworkManagerBase(ABC):
         timeout: Tuple[int, int] = REQUEST_TIMEOUT,
         maxTimeout: Tuple[int, int] = MAX_REQUEST_TIMEOUT,
         stream: bool = False,
-        retryCount: int = 0
+        retryCount: int = 0,
+        compress: bool = False
     ) -> NetworkResponse:
 
         """
@@ -211,6 +236,9 @@ class NetworkManagerBase(ABC):
                 timeout for the request, default <connection: 60s>, <read: 180s>
             retryCount : int
                 retry number of request - only for internal use
+            compress : bool
+                if True json body larger than 1 KB will be sent gzip compressed,
+                server must support "Content-Encoding: gzip" for the endpoint
 
             Returns
             -------
@@ -226,55 +254,68 @@ class NetworkManagerBase(ABC):
 
         url = self.serverUrl + endpoint
 
-        # Log request debug data
-        logger.debug(f">> [Coretex] Sending request to \"{url}\"")
-        logger.debug(f"\tType: {requestType}")
-        logger.debug(f"\tHeaders: {headers}")
-        logger.debug(f"\tQuery: {query}")
-        logger.debug(f"\tBody: {body}")
-        logger.debug(f"\tFiles: {logFilesData(files)}")
-        logger.debug(f"\tAuth: {auth}")
-        logger.debug(f"\tStream: {stream}")
-        logger.debug(f"\tTimeout: {timeout}")
-        logger.debug(f"\tMax timeout: {maxTimeout}")
-        logger.debug(f"\tRetry count: {retryCount}")
+        # Log request debug data, skipped if debug logging is disabled since
+        # formatting the body and measuring files can be expensive
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f">> [Coretex] Sending request to \"{url}\"")
+            logger.debug(f"\tType: {requestType}")
+            logger.debug(f"\tHeaders: {headers}")
+            logger.debug(f"\tQuery: {query}")
+            logger.debug(f"\tBody: {body}")
+            logger.debug(f"\tFiles: {logFilesData(files)}")
+            logger.debug(f"\tAuth: {auth}")
+            logger.debug(f"\tStream: {stream}")
+            logger.debug(f"\tCompress: {compress}")
+            logger.debug(f"\tTimeout: {timeout}")
+            logger.debug(f"\tMax timeout: {maxTimeout}")
+            logger.debug(f"\tRetry count: {retryCount}")
 
         # If Content-Type is application/json make sure that body is converted to json
         data: Optional[Any] = body
         if headers.get("Content-Type") == "application/json" and data is not None:
-            data = json.dumps(body)
-
-        try:
-            rawResponse = self._session.request(
-                requestType.value,
-                url,
-                params = query,
-                data = data,
-                auth = auth,
-                timeout = timeout,
-                files = files,
-                headers = headers
-            )
+            # Compact separators, whitespace only increases the size of request body
+            data = json.dumps(body, separators = (",", ":"))
 
-            response = NetworkResponse(rawResponse, endpoint)
-            if response.hasFailed():
-                logRequestFailure(endpoint, response)
+            if compress:
+                encodedData = data.encode("utf-8")
 
-            if self.shouldRetry(retryCount, response):
-                if self._apiToken is not None:
-                    headers[API_TOKEN_HEADER] = self._apiToken
+                if len(encodedData) > MIN_COMPRESSION_SIZE:
+                    # Lowest compression level, json compresses well even with it
+                    data = gzip.compress(encodedData, compresslevel = 1)
+                    headers["Content-Encoding"] = "gzip"
 
-                if response.statusCode == HTTPStatus.TOO_MANY_REQUESTS:
-                    # If the rate limiter is hit sleep before retrying the request
-                    sleepBeforeRetry(retryCount, endpoint)
+        # Requests are retried in a loop so request data is prepared and logged only once
+        while True:
+            try:
+                rawResponse = self._session.request(
+                    requestType.value,
+                    url,
+                    params = query,
+                    data = data,
+                    auth = auth,
+                    timeout = timeout,
+                    # requests accepts any bytes-like file content (e.g. memoryview), its stubs only declare bytes
+                    files = files,  # type: ignore[arg-type]
+                    headers = headers,
+                    stream = stream
+                )
 
-                return self.request(endpoint, requestType, headers, query, body, files, auth, timeout, maxTimeout, stream, retryCount + 1)
+                response = NetworkResponse(rawResponse, endpoint)
+                if response.hasFailed():
+                    logRequestFailure(endpoint, response)
 
-            return response
-        except requests.exceptions.RequestException as ex:
-            logger.debug(f">> [Coretex] Request failed. Reason \"{ex}\"", exc_info = ex)
+                if not self.shouldRetry(retryCount, response, headers.get(API_TOKEN_HEADER)):
+                    return response
+
+                if response.statusCode in RETRY_STATUS_CODES:
+                    # If the server is overloaded or failing sleep before retrying the request
+                    sleepBeforeRetry(retryCount, endpoint)
+            except requests.exceptions.RequestException as ex:
+                logger.debug(f">> [Coretex] Request failed. Reason \"{ex}\"", exc_info = ex)
+
+                if not self.shouldRetry(retryCount, None):
+                    raise RequestFailedError(endpoint, requestType)
 
-            if self.shouldRetry(retryCount, None):
                 # If an exception happened during the request add a delay before retrying
                 sleepBeforeRetry(retryCount, endpoint)
 
@@ -285,12 +326,13 @@ class NetworkManagerBase(ABC):
 
                     logger.debug(f">> [Coretex] \"{endpoint}\" failed failed due to timeout. Increasing the timeout from {oldTimeout} to {timeout}")
 
-                if self._apiToken is not None:
-                    headers[API_TOKEN_HEADER] = self._apiToken
+            # Token could have been refreshed in the meantime, refresh request
+            # is sent with the refresh token so it must not be replaced
+            if self._apiToken is not None and endpoint != REFRESH_ENDPOINT:
+                headers[API_TOKEN_HEADER] = self._apiToken
 
-                return self.request(endpoint, requestType, headers, query, body, files, auth, timeout, maxTimeout, stream, retryCount + 1)
-
-            raise RequestFailedError(endpoint, requestType)
+            retryCount += 1
+            logger.debug(f">> [Coretex] Retrying \"{endpoint}\" request. Retry count: {retryCount}")
 
     def head(
         self,
@@ -325,7 +367,7 @@ class NetworkManagerBase(ABC):
 
         return self.request(endpoint, RequestType.head, headers, query = params)
 
-    def post(self, endpoint: str, params: Optional[RequestBodyType] = None) -> NetworkResponse:
+    def post(self, endpoint: str, params: Optional[RequestBodyType] = None, compress: bool = False) -> NetworkResponse:
         """
             Sends post HTTP request
 
@@ -335,6 +377,8 @@ class NetworkManagerBase(ABC):
                 endpoint to which the request is sent
             params : Optional[RequestBodyType]
                 body of the request
+            compress : bool
+                if True body larger than 1 KB will be sent gzip compressed
 
             Returns
             -------
@@ -345,7 +389,7 @@ class NetworkManagerBase(ABC):
             RequestFailedError -> if request failed due to connection issues
         """
 
-        return self.request(endpoint, RequestType.post, body = params)
+        return self.request(endpoint, RequestType.post, body = params, compress = compress)
 
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> NetworkResponse:
         """
@@ -369,7 +413,7 @@ class NetworkManagerBase(ABC):
 
         return self.request(endpoint, RequestType.get, query = params)
 
-    def put(self, endpoint: str, params: Optional[RequestBodyType] = None) -> NetworkResponse:
+    def put(self, endpoint: str, params: Optional[RequestBodyType] = None, compress: bool = False) -> NetworkResponse:
         """
             Sends put HTTP request
 
@@ -379,6 +423,8 @@ class NetworkManagerBase(ABC):
                 endpoint to which the request is sent
             params : Optional[RequestBodyType]
                 body of the request
+            compress : bool
+                if True body larger than 1 KB will be sent gzip compressed
 
             Returns
             -------
@@ -389,7 +435,7 @@ class NetworkManagerBase(ABC):
             RequestFailedError -> if request failed due to connection issues
         """
 
-        return self.request(endpoint, RequestType.put, body = params)
+        return self.request(endpoint, RequestType.put, body = params, compress = compress)
 
     def delete(self, endpoint: str) -> NetworkResponse:
         """
@@ -614,24 +660,50 @@ class NetworkManagerBase(ABC):
             headers = {**self._headers(), **headers}
 
         # Timeout for download applies per chunk, not for the full file download
-        response = self.request(
-            endpoint,
-            RequestType.get,
-            headers,
-            query = params,
-            stream = True,
-            timeout = DOWNLOAD_TIMEOUT,
-            maxTimeout = MAX_DOWNLOAD_TIMEOUT
-        )
+        timeout = DOWNLOAD_TIMEOUT
+        retryCount = 0
 
-        if response.hasFailed():
-            return response
+        while True:
+            # Retry count is shared with request() so the whole download is
+            # attempted at most MAX_RETRY_COUNT + 1 times
+            response = self.request(
+                endpoint,
+                RequestType.get,
+                headers,
+                query = params,
+                stream = True,
+                timeout = timeout,
+                maxTimeout = MAX_DOWNLOAD_TIMEOUT,
+                retryCount = retryCount
+            )
 
-        with destination.open("wb") as file:
-            for chunk in response.stream(chunkSize = DOWNLOAD_CHUNK_SIZE):
-                file.write(chunk)
+            if response.hasFailed():
+                return response
 
-        return response
+            # Body is streamed outside of request(), so failures while reading
+            # it have to be handled here
+            try:
+                with destination.open("wb") as file:
+                    for chunk in response.stream(chunkSize = DOWNLOAD_CHUNK_SIZE):
+                        file.write(chunk)
+
+                return response
+            except requests.exceptions.RequestException as ex:
+                logger.debug(f">> [Coretex] Download of \"{endpoint}\" failed. Reason \"{ex}\"", exc_info = ex)
+
+                # Remove partially downloaded file
+                destination.unlink(missing_ok = True)
+
+                if retryCount >= MAX_RETRY_COUNT:
+                    raise RequestFailedError(endpoint, RequestType.get)
+
+                sleepBeforeRetry(retryCount, endpoint)
+
+                if isinstance(ex, requests.exceptions.ConnectionError) and "timeout" in str(ex):
+                    timeout = getTimeoutForRetry(retryCount + 1, timeout, MAX_DOWNLOAD_TIMEOUT)
+
+            retryCount += 1
+            logger.debug(f">> [Coretex] Retrying \"{endpoint}\" download. Retry count: {retryCount}")
 
     def refreshToken(self) -> NetworkResponse:
         """
@@ -31,7 +31,7 @@ logger = logging.getLogger("coretexpylib")
 
 
 RequestBodyType = Dict[str, Any]
-RequestFormType = List[Tuple[str, Tuple[str, Union[bytes, BinaryIO], str]]]
+RequestFormType = List[Tuple[str, Tuple[str, Union[bytes, memoryview, BinaryIO], str]]]
 
 
 def logFilesData(files: Optional[RequestFormType]) -> List[Dict[str, Any]]:
@@ -41,7 +41,7 @@ def logFilesData(files: Optional[RequestFormType]) -> List[Dict[str, Any]]:
     debugFilesData: List[Dict[str, Any]] = []
 
     for paramName, (fileName, fileData, mimeType) in files:
-        if isinstance(fileData, bytes):
+        if isinstance(fileData, (bytes, memoryview)):
             fileSize = len(fileData)
         else:
             fileSize = fileData.seek(0, io.SEEK_END)
@@ -1,5 +1,6 @@
 from typing import Dict, Any, List, Tuple, Optional
 from pathlib import Path
+from functools import lru_cache
 
 import json
 import platform
@@ -153,11 +154,28 @@ def imageInspect(image: str) -> Dict[str, Any]:
     return jsonOutput[0]
 
 
-def getResourceLimits() -> Tuple[int, int]:
+@lru_cache(maxsize = 1)
+def _dockerInfo() -> Dict[str, Any]:
+    # "docker info" output does not change during the lifetime of the process
+    # so the daemon is queried only once and the result is shared between callers
     _, output, _ = command(["docker", "info", "--format", "{{json .}}"], ignoreStdout = True, ignoreStderr = True)
     jsonOutput = json.loads(output)
+    if not isinstance(jsonOutput, dict):
+        raise TypeError(f"Invalid function result type \"{type(jsonOutput)}\". Expected: \"dict\"")
+
+    return jsonOutput
 
-    return jsonOutput["NCPU"], round(jsonOutput["MemTotal"] / (1024 ** 3))
+
+def clearCache() -> None:
+    # Cached docker values are valid for a single command invocation,
+    # long-running processes should clear them before reusing
+    _dockerInfo.cache_clear()
+    getDockerSwapLimit.cache_clear()
+
+
+def getResourceLimits() -> Tuple[int, int]:
+    dockerInfo = _dockerInfo()
+    return dockerInfo["NCPU"], round(dockerInfo["MemTotal"] / (1024 ** 3))
 
 
 def getDockerConfigPath() -> Optional[Path]:
@@ -171,6 +189,7 @@ def getDockerConfigPath() -> Optional[Path]:
         return None
 
 
+@lru_cache(maxsize = 1)
 def getDockerSwapLimit() -> int:
     configPath = getDockerConfigPath()
 
@@ -208,10 +227,7 @@ def getLogs(name: str, tail: Optional[int], follow: bool, timestamps: bool) -> N
 
 def isDockerDesktop() -> bool:
     try:
-        _, output, _ = command(["docker", "info", "--format", "{{json .}}"], ignoreStdout = True, ignoreStderr = True)
-        jsonOutput = json.loads(output)
-
-        clientInfo = jsonOutput.get("ClientInfo")
+        clientInfo = _dockerInfo().get("ClientInfo")
         if not isinstance(clientInfo, dict):
             return False
 
@@ -18,6 +18,7 @@
 from typing import Generator, Optional, Union
 from pathlib import Path
 from zipfile import ZipFile
+from functools import lru_cache
 
 import mimetypes
 import zipfile
@@ -36,6 +37,17 @@ class InvalidFileExtension(Exception):
     pass
 
 
+@lru_cache(maxsize = 1024)
+def _guessMimeTypeForName(fileName: str) -> str:
+    mimeTypesResult = mimetypes.guess_type(fileName)
+
+    mimeType = mimeTypesResult[0]
+    if mimeType is None:
+        return "application/octet-stream"
+
+    return mimeType
+
+
 def guessMimeType(filePath: Union[Path, str]) -> str:
     """
         Tries to guess mime type of the file
@@ -51,13 +63,9 @@ def guessMimeType(filePath: Union[Path, str]) -> str:
         it was not possible to guess
     """
 
-    mimeTypesResult = mimetypes.guess_type(filePath)
-
-    mimeType = mimeTypesResult[0]
-    if mimeType is None:
-        return "application/octet-stream"
-
-    return mimeType
+    # Mime type depends only on the file name, so the result
+    # can be shared between all files with the same name
+    return _guessMimeTypeForName(Path(filePath).name)
 
 
 def isGzip(path: Path) -> bool:
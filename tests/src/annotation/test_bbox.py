@@ -0,0 +1,63 @@
+#     Copyright (C) 2023  Coretex LLC
+
+#     This file is part of Coretex.ai
+
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU Affero General Public License as
+#     published by the Free Software Foundation, either version 3 of the
+#     License, or (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU Affero General Public License for more details.
+
+#     You should have received a copy of the GNU Affero General Public License
+#     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+
+import numpy as np
+
+from coretex import BBox
+
+
+class TestBBoxFromPolys(unittest.TestCase):
+
+    def test_raggedPolygons(self) -> None:
+        polygons = [
+            [0, 0, 0, 3, 4, 3, 4, 0],
+            [1, 1, 2, 5, 6, 2],
+            [10.5, 20, 7, 25.5, 12, 21, 9, 30, 8, 22]
+        ]
+
+        bboxes = BBox.fromPolys(polygons)
+
+        self.assertEqual(bboxes.shape, (3, 4))
+        self.assertEqual(bboxes.dtype, np.float32)
+
+        for polygon, row in zip(polygons, bboxes.tolist()):
+            expected = BBox.fromPoly(polygon)
+            self.assertEqual(row, [expected.minX, expected.minY, expected.width, expected.height])
+
+    def test_singlePointPolygon(self) -> None:
+        bboxes = BBox.fromPolys([[3, 4], [0, 0, 2, 2]])
+
+        self.assertEqual(bboxes.tolist(), [[3, 4, 0, 0], [0, 0, 2, 2]])
+
+    def test_emptyInput(self) -> None:
+        bboxes = BBox.fromPolys([])
+
+        self.assertEqual(bboxes.shape, (0, 4))
+        self.assertEqual(bboxes.dtype, np.float32)
+
+    def test_invalidPolygons(self) -> None:
+        with self.assertRaises(ValueError):
+            BBox.fromPolys([[0, 0, 1, 1], [0, 0, 1]])
+
+        with self.assertRaises(ValueError):
+            BBox.fromPolys([[0, 0, 1, 1], []])
+
+
+if __name__ == "__main__":
+    unittest.main()
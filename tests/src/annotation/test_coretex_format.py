@@ -0,0 +1,54 @@
+#     Copyright (C) 2023  Coretex LLC
+
+#     This file is part of Coretex.ai
+
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU Affero General Public License as
+#     published by the Free Software Foundation, either version 3 of the
+#     License, or (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU Affero General Public License for more details.
+
+#     You should have received a copy of the GNU Affero General Public License
+#     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import List
+
+import uuid
+import unittest
+
+from coretex import BBox, CoretexSegmentationInstance
+
+
+def createInstance(segmentations: List[List[int]]) -> CoretexSegmentationInstance:
+    return CoretexSegmentationInstance.create(uuid.uuid4(), BBox(0, 0, 10, 10), segmentations)
+
+
+class TestSegmentationTransforms(unittest.TestCase):
+
+    def test_rotateWithoutSegmentations(self) -> None:
+        instance = createInstance([])
+        instance.rotateSegmentations(90, (5, 5))
+
+        self.assertEqual(instance.segmentations, [])
+
+    def test_centerKeepsIntegerCoordinatesWithEmptyPolygon(self) -> None:
+        instance = createInstance([[0, 0, 10, 0, 10, 10], []])
+        instance.centerSegmentations((5, 5))
+
+        self.assertEqual(instance.segmentations, [[-1, 2, 9, 2, 9, 12], []])
+        self.assertTrue(all(isinstance(value, int) for value in instance.segmentations[0]))
+
+    def test_rotateKeepsIntegerCoordinatesWithEmptyPolygon(self) -> None:
+        instance = createInstance([[], [0, 0, 10, 0, 10, 10]])
+        instance.rotateSegmentations(90, (0, 0))
+
+        self.assertEqual(instance.segmentations, [[], [0, 0, 0, -10, 10, -10]])
+        self.assertTrue(all(isinstance(value, int) for value in instance.segmentations[1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+#     Copyright (C) 2023  Coretex LLC
+
+#     This file is part of Coretex.ai
+
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU Affero General Public License as
+#     published by the Free Software Foundation, either version 3 of the
+#     License, or (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU Affero General Public License for more details.
+
+#     You should have received a copy of the GNU Affero General Public License
+#     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import List
+from pathlib import Path
+from unittest import mock
+
+import tempfile
+import unittest
+
+from click.testing import CliRunner
+
+from coretex.cli.commands import node as node_command
+from coretex.cli.modules import cron, systemd, update
+from coretex.utils import CommandException
+
+
+class TestSystemd(unittest.TestCase):
+
+    def test_isAvailableRequiresUserManager(self) -> None:
+        with mock.patch.object(systemd.shutil, "which", return_value = "/usr/bin/systemctl"), \
+            mock.patch.object(Path, "exists", return_value = True), \
+            mock.patch.object(systemd, "command", return_value = (1, "", "Failed to connect to bus")) as command:
+
+            self.assertFalse(systemd.isAvailable())
+            self.assertEqual(command.call_args[0][0], ["systemctl", "--user", "show-environment"])
+
+    def test_isLingerEnabled(self) -> None:
+        with mock.patch.object(systemd.shutil, "which", return_value = "/usr/bin/loginctl"):
+            with mock.patch.object(systemd, "command", return_value = (0, "\nLinger=yes\n", "")):
+                self.assertTrue(systemd.isLingerEnabled())
+
+            with mock.patch.object(systemd, "command", return_value = (0, "\nLinger=no\n", "")):
+                self.assertFalse(systemd.isLingerEnabled())
+
+    def test_enableLingerFailsIfDenied(self) -> None:
+        with mock.patch.object(systemd.shutil, "which", return_value = "/usr/bin/loginctl"), \
+            mock.patch.object(systemd, "command", return_value = (1, "\nLinger=no\n", "")) as command:
+
+            self.assertFalse(systemd.enableLinger())
+            self.assertIn(mock.call(["loginctl", "enable-linger"], ignoreStdout = True, ignoreStderr = True, check = False), command.call_args_list)
+
+    def test_enableServiceRestartsService(self) -> None:
+        with tempfile.TemporaryDirectory() as serviceDir, \
+            mock.patch.object(systemd, "SERVICE_DIR", Path(serviceDir)), \
+            mock.patch.object(systemd, "command", return_value = (0, "", "")) as command:
+
+            systemd.enableService("test.service", "content")
+
+            self.assertEqual(Path(serviceDir, "test.service").read_text(), "content")
+            self.assertEqual(command.call_args[0][0], ["systemctl", "--user", "restart", "test.service"])
+
+    def test_serviceIsNotCurrentIfInactive(self) -> None:
+        with tempfile.TemporaryDirectory() as serviceDir, mock.patch.object(systemd, "SERVICE_DIR", Path(serviceDir)):
+            Path(serviceDir, "test.service").write_text("content")
+
+            # is-enabled succeeds, is-active fails
+            with mock.patch.object(systemd, "command", side_effect = [(0, "", ""), (3, "", "")]):
+                self.assertFalse(systemd.isServiceCurrent("test.service", "content"))
+
+            self.assertFalse(systemd.isServiceCurrent("test.service", "changed content"))
+
+    def test_disableServiceStopsService(self) -> None:
+        with tempfile.TemporaryDirectory() as serviceDir, \
+            mock.patch.object(systemd, "SERVICE_DIR", Path(serviceDir)), \
+            mock.patch.object(systemd, "command", return_value = (0, "", "")) as command:
+
+            # Service which is not installed is not touched
+            systemd.disableService("test.service")
+            command.assert_not_called()
+
+            Path(serviceDir, "test.service").write_text("content")
+            systemd.disableService("test.service")
+
+            self.assertEqual(command.call_args[0][0], ["systemctl", "--user", "disable", "--now", "test.service"])
+
+
+class TestActivateAutoUpdate(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.enableService = mock.MagicMock()
+        self.disableService = mock.MagicMock()
+
+    def __activate(self, enableError: bool, lingerEnabled: bool) -> mock.MagicMock:
+        if enableError:
+            self.enableService.side_effect = CommandException("failed")
+
+        with mock.patch.object(update, "generateUpdateService", return_value = "content"), \
+            mock.patch.object(update, "dumpScript"), \
+            mock.patch.object(systemd, "isAvailable", return_value = True), \
+            mock.patch.object(systemd, "isServiceCurrent", return_value = False), \
+            mock.patch.object(systemd, "enableLinger", return_value = lingerEnabled), \
+            mock.patch.object(systemd, "enableService", self.enableService), \
+            mock.patch.object(systemd, "disableService", self.disableService), \
+            mock.patch.object(update, "cron") as cronMock:
+
+            cronMock.getExisting.return_value = []
+            cronMock.jobExists.return_value = False
+
+            update.activateAutoUpdate()
+            return cronMock
+
+    def test_usesServiceIfEnabled(self) -> None:
+        cronMock = self.__activate(enableError = False, lingerEnabled = True)
+
+        cronMock.scheduleJob.assert_not_called()
+        self.enableService.assert_called_once()
+        self.disableService.assert_not_called()
+
+    def test_fallsBackToCronIfServiceFails(self) -> None:
+        cronMock = self.__activate(enableError = True, lingerEnabled = True)
+
+        cronMock.scheduleJob.assert_called_once()
+        self.disableService.assert_called_once_with(update.UPDATE_SERVICE_NAME)
+
+    def test_fallsBackToCronWithoutLinger(self) -> None:
+        cronMock = self.__activate(enableError = False, lingerEnabled = False)
+
+        # Service and cron job must never be active at the same time
+        cronMock.scheduleJob.assert_called_once()
+        self.enableService.assert_not_called()
+        self.disableService.assert_called_once_with(update.UPDATE_SERVICE_NAME)
+
+    def test_servicePathContainsSystemDirectories(self) -> None:
+        with mock.patch.object(update, "getExecPath", return_value = "/opt/bin"):
+            service = update.generateUpdateService()
+
+        # systemctl and other system tools must be found regardless of docker location
+        pathLine = next(line for line in service.splitlines() if line.startswith("Environment=PATH="))
+        self.assertEqual(pathLine.split("=", 2)[2].split(":")[-3:], ["/usr/local/bin", "/usr/bin", "/bin"])
+
+
+class TestCron(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        cron.clearCache()
+
+    def test_removeJob(self) -> None:
+        installed: List[str] = []
+
+        def crontab(args: List[str], **kwargs: object) -> None:
+            installed.extend(Path(args[1]).read_text().splitlines())
+
+        existing = ["0 * * * * /path/first.sh", "*/30 * * * * /path/update_node.sh", "0 0 * * * /path/second.sh"]
+
+        with mock.patch.object(cron, "command", side_effect = crontab):
+            cron.removeJob("update_node.sh", existing)
+
+        self.assertEqual(installed, [existing[0], existing[2]])
+        self.assertEqual(cron.getExisting(), [existing[0], existing[2]])
+
+
+class TestWatchUpdates(unittest.TestCase):
+
+    def test_clearsCachesAndExitsOnLibraryUpgrade(self) -> None:
+        updateMock = mock.MagicMock()
+
+        with mock.patch.object(node_command, "update", updateMock), \
+            mock.patch.object(node_command.time, "sleep"), \
+            mock.patch.object(node_command, "getLibraryVersion", side_effect = ["1.0.0", "1.0.0", "1.0.1"]), \
+            mock.patch.object(node_command.docker, "clearCache") as clearDockerCache, \
+            mock.patch.object(node_command.cron, "clearCache") as clearCronCache:
+
+            result = CliRunner().invoke(node_command.watchUpdates, ["--interval", "0"])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(updateMock.call_count, 2)
+        self.assertEqual(clearDockerCache.call_count, 2)
+        self.assertEqual(clearCronCache.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
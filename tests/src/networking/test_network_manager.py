@@ -0,0 +1,293 @@
+#     Copyright (C) 2023  Coretex LLC
+
+#     This file is part of Coretex.ai
+
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU Affero General Public License as
+#     published by the Free Software Foundation, either version 3 of the
+#     License, or (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU Affero General Public License for more details.
+
+#     You should have received a copy of the GNU Affero General Public License
+#     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Optional, Any, List, Iterator
+from pathlib import Path
+from unittest import mock
+
+import os
+import json
+import gzip
+import tempfile
+import unittest
+
+import requests
+
+from coretex.networking import RequestType
+from coretex.networking.network_manager_base import NetworkManagerBase, RequestFailedError, REFRESH_ENDPOINT, API_TOKEN_HEADER, MAX_RETRY_COUNT, MAX_REQUEST_TIMEOUT
+
+
+class DummyNetworkManager(NetworkManagerBase):
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.__apiToken: Optional[str] = "apiToken"
+        self.__refreshToken: Optional[str] = "refreshToken"
+
+    @property
+    def _apiToken(self) -> Optional[str]:
+        return self.__apiToken
+
+    @_apiToken.setter
+    def _apiToken(self, value: Optional[str]) -> None:
+        self.__apiToken = value
+
+    @property
+    def _refreshToken(self) -> Optional[str]:
+        return self.__refreshToken
+
+    @_refreshToken.setter
+    def _refreshToken(self, value: Optional[str]) -> None:
+        self.__refreshToken = value
+
+
+def unauthorizedResponse() -> mock.MagicMock:
+    response = mock.MagicMock()
+    response.isUnauthorized.return_value = True
+    response.endpoint = "dummy"
+
+    return response
+
+
+class TestTokenRefresh(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.networkManager = DummyNetworkManager()
+
+    def test_refreshesExpiredToken(self) -> None:
+        with mock.patch.object(self.networkManager, "refreshToken") as refreshToken:
+            refreshToken.return_value.hasFailed.return_value = False
+
+            self.assertTrue(self.networkManager.shouldRetry(0, unauthorizedResponse(), "apiToken"))
+            refreshToken.assert_called_once()
+
+    def test_skipsRefreshIfTokenAlreadyRefreshed(self) -> None:
+        # Another request refreshed the token while this one was in flight
+        self.networkManager._apiToken = "newApiToken"
+
+        with mock.patch.object(self.networkManager, "refreshToken") as refreshToken:
+            self.assertTrue(self.networkManager.shouldRetry(0, unauthorizedResponse(), "apiToken"))
+            refreshToken.assert_not_called()
+
+    def test_doesNotRetryIfRefreshFailed(self) -> None:
+        with mock.patch.object(self.networkManager, "refreshToken") as refreshToken:
+            refreshToken.return_value.hasFailed.return_value = True
+
+            self.assertFalse(self.networkManager.shouldRetry(0, unauthorizedResponse(), "apiToken"))
+
+
+def okResponse() -> mock.MagicMock:
+    response = mock.MagicMock()
+    response.ok = True
+    response.status_code = 200
+
+    return response
+
+
+class TestCompression(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.networkManager = DummyNetworkManager()
+
+        environment = mock.patch.dict(os.environ, { "CTX_API_URL": "http://localhost/" })
+        environment.start()
+        self.addCleanup(environment.stop)
+
+    def test_compressesLargeBody(self) -> None:
+        body = { "values": list(range(1000)) }
+
+        with mock.patch.object(self.networkManager._session, "request", return_value = okResponse()) as request:
+            self.networkManager.post("dummy", body, compress = True)
+
+        kwargs = request.call_args.kwargs
+        self.assertEqual(kwargs["headers"]["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(kwargs["data"])), body)
+
+    def test_doesNotCompressSmallBody(self) -> None:
+        with mock.patch.object(self.networkManager._session, "request", return_value = okResponse()) as request:
+            self.networkManager.put("dummy", { "value": 1 }, compress = True)
+
+        kwargs = request.call_args.kwargs
+        self.assertNotIn("Content-Encoding", kwargs["headers"])
+        self.assertEqual(json.loads(kwargs["data"]), { "value": 1 })
+
+
+def failedResponse(statusCode: int) -> mock.MagicMock:
+    response = mock.MagicMock()
+    response.ok = False
+    response.status_code = statusCode
+    response.json.side_effect = ValueError
+    response.content = b""
+
+    return response
+
+
+class TestRetry(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.networkManager = DummyNetworkManager()
+
+        environment = mock.patch.dict(os.environ, { "CTX_API_URL": "http://localhost/" })
+        environment.start()
+        self.addCleanup(environment.stop)
+
+        sleepBeforeRetry = mock.patch("coretex.networking.network_manager_base.sleepBeforeRetry")
+        self.sleepBeforeRetry = sleepBeforeRetry.start()
+        self.addCleanup(sleepBeforeRetry.stop)
+
+    def test_backsOffOnServerErrors(self) -> None:
+        responses = [failedResponse(500), failedResponse(503), okResponse()]
+
+        with mock.patch.object(self.networkManager._session, "request", side_effect = responses) as request:
+            response = self.networkManager.get("dummy")
+
+        self.assertFalse(response.hasFailed())
+        self.assertEqual(request.call_count, 3)
+        self.assertEqual(self.sleepBeforeRetry.call_args_list, [mock.call(0, "dummy"), mock.call(1, "dummy")])
+
+    def test_stopsAfterMaxRetryCount(self) -> None:
+        with mock.patch.object(self.networkManager._session, "request", return_value = failedResponse(503)) as request:
+            response = self.networkManager.get("dummy")
+
+        self.assertEqual(response.statusCode, 503)
+        self.assertEqual(request.call_count, MAX_RETRY_COUNT + 1)
+
+    def test_doesNotRetryClientErrors(self) -> None:
+        with mock.patch.object(self.networkManager._session, "request", return_value = failedResponse(404)) as request:
+            response = self.networkManager.get("dummy")
+
+        self.assertEqual(response.statusCode, 404)
+        self.assertEqual(request.call_count, 1)
+        self.sleepBeforeRetry.assert_not_called()
+
+    def test_refreshRetryKeepsRefreshToken(self) -> None:
+        sentTokens: List[Optional[str]] = []
+
+        def request(*args: Any, **kwargs: Any) -> mock.MagicMock:
+            sentTokens.append(kwargs["headers"].get(API_TOKEN_HEADER))
+
+            # API token changes while the refresh request is being retried
+            self.networkManager._apiToken = "newApiToken"
+            return failedResponse(503) if len(sentTokens) == 1 else okResponse()
+
+        headers = self.networkManager._headers()
+        headers[API_TOKEN_HEADER] = "refreshToken"
+
+        with mock.patch.object(self.networkManager._session, "request", side_effect = request):
+            self.networkManager.request(REFRESH_ENDPOINT, RequestType.post, headers = headers)
+
+        self.assertEqual(sentTokens, ["refreshToken", "refreshToken"])
+
+    def test_retryUsesLatestApiToken(self) -> None:
+        sentTokens: List[Optional[str]] = []
+
+        def request(*args: Any, **kwargs: Any) -> mock.MagicMock:
+            sentTokens.append(kwargs["headers"].get(API_TOKEN_HEADER))
+
+            self.networkManager._apiToken = "newApiToken"
+            return failedResponse(503) if len(sentTokens) == 1 else okResponse()
+
+        with mock.patch.object(self.networkManager._session, "request", side_effect = request):
+            self.networkManager.get("dummy")
+
+        self.assertEqual(sentTokens, ["apiToken", "newApiToken"])
+
+    def test_retriesConnectionError(self) -> None:
+        responses = [requests.exceptions.ConnectionError("Connection reset by peer"), okResponse()]
+
+        with mock.patch.object(self.networkManager._session, "request", side_effect = responses) as request:
+            response = self.networkManager.get("dummy")
+
+        self.assertFalse(response.hasFailed())
+        self.sleepBeforeRetry.assert_called_once_with(0, "dummy")
+
+        # Timeout is increased only if the request timed out
+        timeouts = [call.kwargs["timeout"] for call in request.call_args_list]
+        self.assertEqual(timeouts[0], timeouts[1])
+
+    def test_raisesAfterMaxRetryCountOnTimeout(self) -> None:
+        error = requests.exceptions.ConnectionError("Read timed out. (read timeout=10)")
+
+        with mock.patch.object(self.networkManager._session, "request", side_effect = error) as request:
+            with self.assertRaises(RequestFailedError):
+                self.networkManager.get("dummy")
+
+        self.assertEqual(request.call_count, MAX_RETRY_COUNT + 1)
+        self.assertEqual(self.sleepBeforeRetry.call_count, MAX_RETRY_COUNT)
+
+        # Timeout grows with every retry, up to the maximum request timeout
+        timeouts = [call.kwargs["timeout"] for call in request.call_args_list]
+        self.assertEqual(timeouts, sorted(timeouts))
+        self.assertGreater(timeouts[-1], timeouts[0])
+        self.assertLessEqual(timeouts[-1], MAX_REQUEST_TIMEOUT)
+
+
+def streamResponse(*chunks: bytes, failAfter: bool = False) -> mock.MagicMock:
+    def iterContent(*args: Any, **kwargs: Any) -> Iterator[bytes]:
+        yield from chunks
+
+        if failAfter:
+            raise requests.exceptions.ChunkedEncodingError("Connection reset by peer")
+
+    response = okResponse()
+    response.iter_content.side_effect = iterContent
+
+    return response
+
+
+class TestDownload(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.networkManager = DummyNetworkManager()
+
+        environment = mock.patch.dict(os.environ, { "CTX_API_URL": "http://localhost/" })
+        environment.start()
+        self.addCleanup(environment.stop)
+
+        sleepBeforeRetry = mock.patch("coretex.networking.network_manager_base.sleepBeforeRetry")
+        self.sleepBeforeRetry = sleepBeforeRetry.start()
+        self.addCleanup(sleepBeforeRetry.stop)
+
+        temporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporaryDirectory.cleanup)
+        self.destination = Path(temporaryDirectory.name) / "file"
+
+    def test_retriesFailureMidStream(self) -> None:
+        responses = [streamResponse(b"abc", failAfter = True), streamResponse(b"abc", b"def")]
+
+        with mock.patch.object(self.networkManager._session, "request", side_effect = responses) as request:
+            response = self.networkManager.download("dummy", self.destination)
+
+        self.assertFalse(response.hasFailed())
+        self.assertEqual(request.call_count, 2)
+        self.assertEqual(self.destination.read_bytes(), b"abcdef")
+        self.sleepBeforeRetry.assert_called_once_with(0, "dummy")
+
+    def test_removesPartialFileAfterMaxRetryCount(self) -> None:
+        responses = [streamResponse(b"abc", failAfter = True) for _ in range(MAX_RETRY_COUNT + 1)]
+
+        with mock.patch.object(self.networkManager._session, "request", side_effect = responses) as request:
+            with self.assertRaises(RequestFailedError):
+                self.networkManager.download("dummy", self.destination)
+
+        self.assertEqual(request.call_count, MAX_RETRY_COUNT + 1)
+        self.assertFalse(self.destination.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()